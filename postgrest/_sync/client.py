@@ -9,6 +9,7 @@ from .. import __version__
 from ..base_client import BasePostgrestClient
 from ..constants import (
     DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_LIMITS,
     DEFAULT_POSTGREST_CLIENT_TIMEOUT,
 )
 from ..utils import SyncClient
@@ -25,26 +26,46 @@ class SyncPostgrestClient(BasePostgrestClient):
         schema: str = "public",
         headers: Dict[str, str] = DEFAULT_POSTGREST_CLIENT_HEADERS,
         timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+        http2: bool = False,
+        coalesce_requests: bool = False,
     ) -> None:
+        """Create a client.
+
+        Args:
+            base_url: The URL of the PostgREST server.
+            schema: The name of the schema to run the queries in.
+            headers: The headers sent with every request.
+            timeout: The timeout of the requests, in seconds or as an ``httpx.Timeout``.
+            http2: Whether to use HTTP/2, which lets concurrent queries share a single
+                connection. It requires the ``http2`` extra to be installed.
+            coalesce_requests: Whether identical GET queries running at the same time
+                should share a single HTTP request. Each of them still gets its own
+                copy of the response.
+        """
         BasePostgrestClient.__init__(
             self,
             base_url,
             schema=schema,
             headers=headers,
             timeout=timeout,
+            http2=http2,
         )
         self.session = cast(SyncClient, self.session)
+        self.session.coalesce_requests = coalesce_requests
 
     def create_session(
         self,
         base_url: str,
         headers: Dict[str, str],
         timeout: Union[int, float, Timeout],
+        http2: bool = False,
     ) -> SyncClient:
         return SyncClient(
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            http2=http2,
+            limits=DEFAULT_POSTGREST_CLIENT_LIMITS,
         )
 
     def __enter__(self) -> SyncPostgrestClient:
@@ -57,6 +78,13 @@ class SyncPostgrestClient(BasePostgrestClient):
         """Close the underlying HTTP connections."""
         self.session.aclose()
 
+    def prewarm(self) -> None:
+        """Open a connection to the server ahead of the first query.
+
+        This saves the TCP and TLS handshakes from the latency of that query.
+        """
+        self.session.head("/")
+
     def from_(self, table: str) -> SyncRequestBuilder:
         """Perform a table operation.
 
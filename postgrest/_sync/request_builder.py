@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional
+from json import JSONDecodeError
+from typing import Any, List, Optional, Tuple, Union
 
-from httpx import Headers, QueryParams
-from pydantic import ValidationError
+from httpx import Headers, QueryParams, Request, Response
 
 from ..base_request_builder import (
     APIResponse,
@@ -17,11 +17,15 @@ from ..base_request_builder import (
     pre_upsert,
 )
 from ..exceptions import APIError
-from ..types import ReturnMethod
-from ..utils import SyncClient
+from ..types import RequestMethod, ReturnMethod
+from ..utils import SyncClient, json_dumps, json_loads, merge_url
 
 
 class SyncQueryRequestBuilder:
+    __slots__ = ("session", "path", "http_method", "headers", "_params", "json")
+
+    _params: List[Tuple[str, Any]]
+
     def __init__(
         self,
         session: SyncClient,
@@ -29,7 +33,7 @@ class SyncQueryRequestBuilder:
         http_method: str,
         headers: Headers,
         params: QueryParams,
-        json: dict,
+        json: Union[dict, List[dict]],
     ) -> None:
         self.session = session
         self.path = path
@@ -38,6 +42,15 @@ class SyncQueryRequestBuilder:
         self.params = params
         self.json = json
 
+    @property
+    def params(self) -> QueryParams:
+        """The query params of the query."""
+        return QueryParams(self._params)
+
+    @params.setter
+    def params(self, params: QueryParams) -> None:
+        self._params = list(params.multi_items())
+
     def execute(self) -> APIResponse:
         """Execute the query.
 
@@ -50,22 +63,48 @@ class SyncQueryRequestBuilder:
         Raises:
             :class:`APIError` If the API raised an error.
         """
-        r = self.session.request(
+        r = self.session.send(self._build_request())
+        return self._handle_response(r)
+
+    def _build_request(self) -> Request:
+        # GET and HEAD queries never have a body
+        content = (
+            None
+            if self.http_method in (RequestMethod.GET, RequestMethod.HEAD)
+            else json_dumps(self.json)
+        )
+        request = self.session.build_request(
             self.http_method,
-            self.path,
-            json=self.json,
-            params=self.params,
+            merge_url(self.session.base_url, self.path),
+            content=content,
+            params=self._params,
             headers=self.headers,
         )
+        if content is not None:
+            request.headers.setdefault("Content-Type", "application/json")
+        return request
 
+    def _handle_response(self, r: Response) -> APIResponse:
+        if r.is_success:
+            return APIResponse.construct_from_http_request_response(r)
         try:
-            return APIResponse.from_http_request_response(r)
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+            body = json_loads(r.content)
+        except JSONDecodeError as e:
+            # e.g. an HTML error page from a proxy in front of PostgREST
+            raise APIError({"message": r.text}) from e
+        # the same check as APIResponse.raise_when_api_error, done here so that
+        # errors (e.g. no rows for single()) do not go through a ValidationError
+        if isinstance(body, dict) and body.get("message"):
+            raise APIError(body)
+        return APIResponse(
+            data=body, count=APIResponse._get_count_from_http_request_response(r)
+        )
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncFilterRequestBuilder(BaseFilterRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -75,14 +114,16 @@ class SyncFilterRequestBuilder(BaseFilterRequestBuilder, SyncQueryRequestBuilder
         params: QueryParams,
         json: dict,
     ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
         SyncQueryRequestBuilder.__init__(
             self, session, path, http_method, headers, params, json
         )
+        self._init_filter_state()
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -92,13 +133,15 @@ class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder
         params: QueryParams,
         json: dict,
     ) -> None:
-        BaseSelectRequestBuilder.__init__(self, session, headers, params)
         SyncQueryRequestBuilder.__init__(
             self, session, path, http_method, headers, params, json
         )
+        self._init_filter_state()
 
 
 class SyncRequestBuilder:
+    __slots__ = ("session", "path")
+
     def __init__(self, session: SyncClient, path: str) -> None:
         self.session = session
         self.path = path
@@ -123,7 +166,7 @@ class SyncRequestBuilder:
 
     def insert(
         self,
-        json: dict,
+        json: Union[dict, List[dict]],
         *,
         count: Optional[CountMethod] = None,
         returning: ReturnMethod = ReturnMethod.representation,
@@ -132,7 +175,7 @@ class SyncRequestBuilder:
         """Run an INSERT query.
 
         Args:
-            json: The row to be inserted.
+            json: The row to be inserted, or a list of rows to insert in bulk.
             count: The method to use to get the count of rows returned.
             returning: Either 'minimal' or 'representation'
             upsert: Whether the query should be an upsert.
@@ -151,7 +194,7 @@ class SyncRequestBuilder:
 
     def upsert(
         self,
-        json: dict,
+        json: Union[dict, List[dict]],
         *,
         count: Optional[CountMethod] = None,
         returning: ReturnMethod = ReturnMethod.representation,
@@ -160,7 +203,7 @@ class SyncRequestBuilder:
         """Run an upsert (INSERT ... ON CONFLICT DO UPDATE) query.
 
         Args:
-            json: The row to be inserted.
+            json: The row to be inserted, or a list of rows to insert in bulk.
             count: The method to use to get the count of rows returned.
             returning: Either 'minimal' or 'representation'
             ignore_duplicates: Whether duplicate rows should be ignored.
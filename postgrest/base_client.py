@@ -18,13 +18,19 @@ class BasePostgrestClient(ABC):
         schema: str,
         headers: Dict[str, str],
         timeout: Union[int, float, Timeout],
+        http2: bool = False,
     ) -> None:
         headers = {
             **headers,
             "Accept-Profile": schema,
             "Content-Profile": schema,
         }
-        self.session = self.create_session(base_url, headers, timeout)
+        # http2 is only passed when enabled, so that subclasses overriding
+        # create_session() without it keep working
+        if http2:
+            self.session = self.create_session(base_url, headers, timeout, http2=True)
+        else:
+            self.session = self.create_session(base_url, headers, timeout)
 
     @abstractmethod
     def create_session(
@@ -32,6 +38,7 @@ class BasePostgrestClient(ABC):
         base_url: str,
         headers: Dict[str, str],
         timeout: Union[int, float, Timeout],
+        http2: bool = False,
     ) -> Union[SyncClient, AsyncClient]:
         raise NotImplementedError()
 
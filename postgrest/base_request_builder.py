@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
-from re import search
+import re
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
     Iterable,
+    List,
     NamedTuple,
     Optional,
     Tuple,
@@ -19,7 +21,7 @@ from httpx import Response as RequestResponse
 from pydantic import BaseModel, validator
 
 from .types import CountMethod, Filters, RequestMethod, ReturnMethod
-from .utils import AsyncClient, SyncClient, sanitize_param
+from .utils import json_loads, sanitize_param
 
 
 class QueryArgs(NamedTuple):
@@ -27,13 +29,15 @@ class QueryArgs(NamedTuple):
     method: RequestMethod
     params: QueryParams
     headers: Headers
-    json: Dict[Any, Any]
+    json: Any
 
 
-def pre_select(
-    *columns: str,
-    count: Optional[CountMethod] = None,
-) -> QueryArgs:
+# the headers built below are cached, but the builders modify their headers
+# (e.g. range() or single()), so every query gets its own copy of them
+@lru_cache(maxsize=256)
+def _select_args(
+    columns: Tuple[str, ...], count: Optional[CountMethod]
+) -> Tuple[RequestMethod, QueryParams, Headers]:
     if columns:
         method = RequestMethod.GET
         params = QueryParams({"select": ",".join(columns)})
@@ -44,38 +48,52 @@ def pre_select(
         headers = Headers({"Prefer": f"count={count}"})
     else:
         headers = Headers()
-    return QueryArgs(method, params, headers, {})
+    return method, params, headers
+
+
+@lru_cache(maxsize=256)
+def _prefer_headers(
+    returning: ReturnMethod,
+    count: Optional[CountMethod],
+    resolution: Optional[str],
+) -> Headers:
+    prefer_headers = [f"return={returning}"]
+    if count:
+        prefer_headers.append(f"count={count}")
+    if resolution:
+        prefer_headers.append(f"resolution={resolution}")
+    return Headers({"Prefer": ",".join(prefer_headers)})
+
+
+def pre_select(
+    *columns: str,
+    count: Optional[CountMethod] = None,
+) -> QueryArgs:
+    method, params, headers = _select_args(columns, count)
+    return QueryArgs(method, params, headers.copy(), {})
 
 
 def pre_insert(
-    json: dict,
+    json: Union[dict, List[dict]],
     *,
     count: Optional[CountMethod],
     returning: ReturnMethod,
     upsert: bool,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    if upsert:
-        prefer_headers.append("resolution=merge-duplicates")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    resolution = "merge-duplicates" if upsert else None
+    headers = _prefer_headers(returning, count, resolution).copy()
     return QueryArgs(RequestMethod.POST, QueryParams(), headers, json)
 
 
 def pre_upsert(
-    json: dict,
+    json: Union[dict, List[dict]],
     *,
     count: Optional[CountMethod],
     returning: ReturnMethod,
     ignore_duplicates: bool,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    resolution = "ignore" if ignore_duplicates else "merge"
-    prefer_headers.append(f"resolution={resolution}-duplicates")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    resolution = "ignore-duplicates" if ignore_duplicates else "merge-duplicates"
+    headers = _prefer_headers(returning, count, resolution).copy()
     return QueryArgs(RequestMethod.POST, QueryParams(), headers, json)
 
 
@@ -85,10 +103,7 @@ def pre_update(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    headers = _prefer_headers(returning, count, None).copy()
     return QueryArgs(RequestMethod.PATCH, QueryParams(), headers, json)
 
 
@@ -97,13 +112,16 @@ def pre_delete(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    headers = _prefer_headers(returning, count, None).copy()
     return QueryArgs(RequestMethod.DELETE, QueryParams(), headers, {})
 
 
+# the set of count methods never changes, so the pattern is only compiled once
+_COUNT_IN_PREFER_HEADER_PATTERN = re.compile(
+    f"count=({'|'.join(cm.value for cm in CountMethod)})"
+)
+
+
 class APIResponse(BaseModel):
     data: Any
     """The data returned by the query."""
@@ -121,15 +139,18 @@ class APIResponse(BaseModel):
     def _get_count_from_content_range_header(
         content_range_header: str,
     ) -> Optional[int]:
-        content_range = content_range_header.split("/")
+        content_range = content_range_header.rsplit("/", 1)
         if len(content_range) < 2:
             return None
-        return int(content_range[1])
+        try:
+            return int(content_range[1])
+        except ValueError:
+            # the total is "*" when PostgREST did not count the rows
+            return None
 
     @staticmethod
     def _is_count_in_prefer_header(prefer_header: str) -> bool:
-        pattern = f"count=({'|'.join([cm.value for cm in CountMethod])})"
-        return bool(search(pattern, prefer_header))
+        return bool(_COUNT_IN_PREFER_HEADER_PATTERN.search(prefer_header))
 
     @classmethod
     def _get_count_from_http_request_response(
@@ -151,25 +172,42 @@ class APIResponse(BaseModel):
     def from_http_request_response(
         cls: Type[APIResponse], request_response: RequestResponse
     ) -> APIResponse:
-        data = request_response.json()
+        data = json_loads(request_response.content)
         count = cls._get_count_from_http_request_response(request_response)
         return cls(data=data, count=count)
 
+    @classmethod
+    def construct_from_http_request_response(
+        cls: Type[APIResponse], request_response: RequestResponse
+    ) -> APIResponse:
+        """Build the response without running the validators.
+
+        Only use this for successful responses: PostgREST never returns an
+        error payload with a 2xx status, so the checks done by the validators
+        are redundant there.
+        """
+        data = json_loads(request_response.content)
+        count = cls._get_count_from_http_request_response(request_response)
+        return cls.construct(data=data, count=count)
+
 
 _FilterT = TypeVar("_FilterT", bound="BaseFilterRequestBuilder")
 
 
 class BaseFilterRequestBuilder:
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        self.session = session
-        self.headers = headers
-        self.params = params
-        self.negate_next = False
+    # the concrete builders store these attributes in their own slots, as two
+    # bases with non-empty slots cannot be combined
+    __slots__ = ()
+
+    headers: Headers
+    # the query params are accumulated in a list and only turned into
+    # QueryParams when needed, as QueryParams.add copies all of them each time
+    _params: List[Tuple[str, Any]]
+    negate_next: bool
+
+    def _init_filter_state(self) -> None:
+        # called by the concrete builders, after they stored the query itself
+        self.negate_next = False  # type: ignore
 
     @property
     def not_(self: _FilterT) -> _FilterT:
@@ -189,7 +227,7 @@ class BaseFilterRequestBuilder:
             self.negate_next = False
             operator = f"{Filters.NOT}.{operator}"
         key, val = sanitize_param(column), f"{operator}.{criteria}"
-        self.params = self.params.add(key, val)
+        self._params.append((key, val))
         return self
 
     def eq(self: _FilterT, column: str, value: Any) -> _FilterT:
@@ -357,13 +395,7 @@ class BaseFilterRequestBuilder:
 
 
 class BaseSelectRequestBuilder(BaseFilterRequestBuilder):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
+    __slots__ = ()
 
     def order(
         self: _FilterT,
@@ -383,9 +415,11 @@ class BaseSelectRequestBuilder(BaseFilterRequestBuilder):
         .. versionchanged:: 0.10.3
            Allow ordering results for foreign tables with the foreign_table parameter.
         """
-        self.params = self.params.add(
-            f"{foreign_table}.order" if foreign_table else "order",
-            f"{column}{'.desc' if desc else ''}{'.nullsfirst' if nullsfirst else ''}",
+        self._params.append(
+            (
+                f"{foreign_table}.order" if foreign_table else "order",
+                f"{column}{'.desc' if desc else ''}{'.nullsfirst' if nullsfirst else ''}",
+            )
         )
         return self
 
@@ -400,9 +434,11 @@ class BaseSelectRequestBuilder(BaseFilterRequestBuilder):
         .. versionchanged:: 0.10.3
            Allow limiting results returned for foreign tables with the foreign_table parameter.
         """
-        self.params = self.params.add(
-            f"{foreign_table}.limit" if foreign_table else "limit",
-            size,
+        self._params.append(
+            (
+                f"{foreign_table}.limit" if foreign_table else "limit",
+                size,
+            )
         )
         return self
 
@@ -1,6 +1,14 @@
+from httpx import Limits
+
 DEFAULT_POSTGREST_CLIENT_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
 DEFAULT_POSTGREST_CLIENT_TIMEOUT = 5
+
+DEFAULT_POSTGREST_CLIENT_LIMITS = Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=30,
+)
@@ -1,12 +1,148 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import json
+from concurrent.futures import CancelledError, Future
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Tuple
 
-from httpx import AsyncClient  # noqa: F401
+from httpx import URL
+from httpx import AsyncClient as BaseAsyncClient  # noqa: F401
 from httpx import Client as BaseClient  # noqa: F401
+from httpx import Request, Response
+
+try:
+    from orjson import OPT_NON_STR_KEYS, OPT_SERIALIZE_NUMPY
+    from orjson import dumps as _orjson_dumps
+
+    def json_dumps(obj: Any) -> bytes:
+        try:
+            # non str keys are converted to strings, as the standard library does
+            return _orjson_dumps(obj, option=OPT_NON_STR_KEYS | OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the standard library supports
+            return json.dumps(obj).encode("utf-8")
+
+except ImportError:  # pragma: no cover
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore
+        return json.dumps(obj).encode("utf-8")
+
+
+# responses are always decoded by the standard library: orjson turns numbers wider
+# than 64 bits (e.g. from numeric columns) into floats, and rejects 1e400
+json_loads = json.loads
+
+
+# these describe how the body was sent over the wire, which does not apply to
+# the already decoded body shared by coalesced requests
+_WIRE_HEADERS = frozenset((b"content-encoding", b"content-length", b"transfer-encoding"))
+
+
+def _coalescing_key(request: Request) -> Tuple[Any, ...]:
+    return (request.method, request.url, tuple(request.headers.raw))
+
+
+def _share_response(response: Response, request: Request) -> Response:
+    """Build a response to a coalesced request from the response to the one sent."""
+    headers = [
+        (key, value)
+        for key, value in response.headers.raw
+        if key.lower() not in _WIRE_HEADERS
+    ]
+    return Response(
+        response.status_code,
+        headers=headers,
+        content=response.content,
+        request=request,
+        extensions=response.extensions,
+    )
+
+
+class AsyncClient(BaseAsyncClient):
+    coalesce_requests: bool = False
+    """Whether identical concurrent GET requests should share a single request.
+
+    Only requests sent with :meth:`send` and its default options are coalesced,
+    which is how queries are sent.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future[Response]] = {}
+
+    async def send(self, request: Request, **kwargs: Any) -> Response:
+        if kwargs or not self.coalesce_requests or request.method != "GET":
+            return await super().send(request, **kwargs)
+        key = _coalescing_key(request)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # wait without cancelling the request of the task which sent it
+            await asyncio.wait({pending})
+            if pending.cancelled():
+                return await self.send(request)
+            return _share_response(pending.result(), request)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await super().send(request)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # the exception is raised here, whether or not anyone waits for it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.cancel()
 
 
 class SyncClient(BaseClient):
+    coalesce_requests: bool = False
+    """Whether identical concurrent GET requests should share a single request.
+
+    Only requests sent with :meth:`send` and its default options are coalesced,
+    which is how queries are sent.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._inflight: Dict[Tuple[Any, ...], Future[Response]] = {}
+        self._inflight_lock = Lock()
+
+    def send(self, request: Request, **kwargs: Any) -> Response:
+        if kwargs or not self.coalesce_requests or request.method != "GET":
+            return super().send(request, **kwargs)
+        key = _coalescing_key(request)
+        future: Future[Response] = Future()
+        with self._inflight_lock:
+            pending = self._inflight.setdefault(key, future)
+        if pending is not future:
+            try:
+                response = pending.result()
+            except CancelledError:
+                return self.send(request)
+            return _share_response(response, request)
+        try:
+            response = super().send(request)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            if not future.done():
+                future.cancel()
+
     def aclose(self) -> None:
         self.close()
 
@@ -21,3 +157,17 @@ def sanitize_param(param: Any) -> str:
 
 def sanitize_pattern_param(pattern: str) -> str:
     return sanitize_param(pattern.replace("%", "*"))
+
+
+@lru_cache(maxsize=256)
+def merge_url(base_url: URL, path: str) -> URL:
+    """Append the path of a query to the base URL of the session.
+
+    httpx parses the URL of every request when it is given as a string, which
+    is avoided by passing it the cached URL instead.
+    """
+    if not base_url.is_absolute_url:
+        return URL(path)
+    # the base URL of a session always ends with a slash, so joining the path
+    # relatively to it appends it to the base URL, as httpx does
+    return base_url.join(f".{path}")
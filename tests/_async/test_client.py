@@ -1,7 +1,9 @@
 import pytest
-from httpx import BasicAuth, Headers
+from httpx import BasicAuth, Headers, MockTransport, Request, Response
 
 from postgrest import AsyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_LIMITS
+from postgrest.utils import AsyncClient
 
 
 @pytest.fixture
@@ -74,3 +76,61 @@ async def test_params_purged_after_execute(postgrest_client: AsyncPostgrestClien
     assert len(postgrest_client.session.params) == 0
     await postgrest_client.from_("test").select("a", "b").eq("c", "d").execute()
     assert len(postgrest_client.session.params) == 0
+
+
+class TestSession:
+    def test_limits(self, postgrest_client: AsyncPostgrestClient):
+        pool = postgrest_client.session._transport._pool
+
+        limits = DEFAULT_POSTGREST_CLIENT_LIMITS
+        assert pool._max_connections == limits.max_connections
+        assert pool._max_keepalive_connections == limits.max_keepalive_connections
+        assert pool._keepalive_expiry == limits.keepalive_expiry
+
+    @pytest.mark.asyncio
+    async def test_http2_passed_to_create_session(self):
+        http2_flags = []
+
+        class Client(AsyncPostgrestClient):
+            def create_session(self, base_url, headers, timeout, http2=False):
+                http2_flags.append(http2)
+                return super().create_session(base_url, headers, timeout)
+
+        async with Client("https://example.com", http2=True):
+            pass
+        async with Client("https://example.com"):
+            pass
+
+        assert http2_flags == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_http2(self):
+        pytest.importorskip("h2")
+        async with AsyncPostgrestClient("https://example.com", http2=True) as client:
+            assert client.session._transport._pool._http2
+
+
+@pytest.mark.asyncio
+async def test_prewarm():
+    sent_requests = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return Response(200)
+
+    class Client(AsyncPostgrestClient):
+        # the signature of create_session() before http2 was added to it
+        def create_session(self, base_url, headers, timeout):
+            return AsyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=timeout,
+                transport=MockTransport(handler),
+            )
+
+    async with Client("https://example.com/rest/v1") as client:
+        await client.prewarm()
+
+    assert len(sent_requests) == 1
+    assert sent_requests[0].method == "HEAD"
+    assert sent_requests[0].url == "https://example.com/rest/v1/"
@@ -1,5 +1,5 @@
 import pytest
-from httpx import Headers, QueryParams
+from httpx import Headers, MockTransport, QueryParams, Request, Response
 
 from postgrest import AsyncFilterRequestBuilder
 from postgrest.utils import AsyncClient
@@ -79,3 +79,22 @@ def test_contained_by_mixed_items(filter_request_builder):
 
     # {a,["b",+"c"]}
     assert str(builder.params) == "x=cd.%7Ba%2C%5B%22b%22%2C+%22c%22%5D%7D"
+
+
+@pytest.mark.asyncio
+async def test_execute_sends_chained_filters():
+    sent_requests = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return Response(200, json=[])
+
+    async with AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builder = AsyncFilterRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams({"select": "*"}), {}
+        )
+        await builder.eq("a", 1).gt("b", 2).execute()
+
+    assert sent_requests[0].url.query == b"select=%2A&a=eq.1&b=gt.2"
@@ -1,7 +1,11 @@
+import json
+from typing import List, Tuple
+
 import pytest
-from httpx import Headers, QueryParams
+from httpx import Headers, MockTransport, QueryParams, Request, Response
 
 from postgrest import AsyncQueryRequestBuilder
+from postgrest.exceptions import APIError
 from postgrest.utils import AsyncClient
 
 
@@ -13,6 +17,20 @@ async def query_request_builder():
         )
 
 
+def mock_client(
+    response: Response, base_url: str = "https://example.com"
+) -> Tuple[AsyncClient, List[Request]]:
+    """Create a client which answers every request with `response`."""
+    sent_requests: List[Request] = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return response
+
+    client = AsyncClient(base_url=base_url, transport=MockTransport(handler))
+    return client, sent_requests
+
+
 def test_constructor(query_request_builder: AsyncQueryRequestBuilder):
     builder = query_request_builder
 
@@ -21,3 +39,84 @@ def test_constructor(query_request_builder: AsyncQueryRequestBuilder):
     assert len(builder.params) == 0
     assert builder.http_method == "GET"
     assert builder.json == {}
+
+
+@pytest.mark.asyncio
+async def test_execute_success():
+    client, _ = mock_client(Response(200, json=[{"id": 1}]))
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        response = await builder.execute()
+
+    assert response.data == [{"id": 1}]
+    assert response.count is None
+
+
+@pytest.mark.asyncio
+async def test_execute_error():
+    client, _ = mock_client(
+        Response(400, json={"message": "bad request", "code": "22P02"})
+    )
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            await builder.execute()
+
+    assert exc_info.value.message == "bad request"
+    assert exc_info.value.code == "22P02"
+
+
+@pytest.mark.asyncio
+async def test_execute_error_not_json():
+    client, _ = mock_client(Response(502, text="Bad Gateway"))
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            await builder.execute()
+
+    assert exc_info.value.message == "Bad Gateway"
+
+
+@pytest.mark.asyncio
+async def test_execute_sends_json_body():
+    client, sent_requests = mock_client(Response(201, json=[{"id": 1}]))
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "POST", Headers(), QueryParams(), {"id": 1}
+        )
+        await builder.execute()
+
+    assert json.loads(sent_requests[0].content) == {"id": 1}
+    assert sent_requests[0].headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_execute_get_has_no_body():
+    client, sent_requests = mock_client(Response(200, json=[]))
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        await builder.execute()
+
+    assert sent_requests[0].content == b""
+
+
+@pytest.mark.asyncio
+async def test_execute_appends_path_to_base_url():
+    client, sent_requests = mock_client(
+        Response(200, json=[]), base_url="https://example.com/rest/v1"
+    )
+    async with client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        await builder.execute()
+
+    assert sent_requests[0].url == "https://example.com/rest/v1/example_table"
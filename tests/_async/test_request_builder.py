@@ -19,6 +19,13 @@ def test_constructor(request_builder):
     assert request_builder.path == "/example_table"
 
 
+def test_builders_use_slots(request_builder: AsyncRequestBuilder):
+    assert not hasattr(request_builder, "__dict__")
+    assert not hasattr(request_builder.select("col1"), "__dict__")
+    assert not hasattr(request_builder.insert({"key1": "val1"}), "__dict__")
+    assert not hasattr(request_builder.delete(), "__dict__")
+
+
 class TestSelect:
     def test_select(self, request_builder: AsyncRequestBuilder):
         builder = request_builder.select("col1", "col2")
@@ -36,6 +43,13 @@ class TestSelect:
         assert builder.http_method == "HEAD"
         assert builder.json == {}
 
+    def test_select_headers_not_shared(self, request_builder: AsyncRequestBuilder):
+        single_builder = request_builder.select("col1").single()
+        builder = request_builder.select("col1")
+
+        assert single_builder.headers["Accept"] == "application/vnd.pgrst.object+json"
+        assert builder.headers.get("Accept") is None
+
 
 class TestInsert:
     def test_insert(self, request_builder: AsyncRequestBuilder):
@@ -45,6 +59,13 @@ class TestInsert:
         assert builder.http_method == "POST"
         assert builder.json == {"key1": "val1"}
 
+    def test_insert_bulk(self, request_builder: AsyncRequestBuilder):
+        builder = request_builder.insert([{"key1": "val1"}, {"key1": "val2"}])
+
+        assert builder.headers.get_list("prefer", True) == ["return=representation"]
+        assert builder.http_method == "POST"
+        assert builder.json == [{"key1": "val1"}, {"key1": "val2"}]
+
     def test_insert_with_count(self, request_builder: AsyncRequestBuilder):
         builder = request_builder.insert({"key1": "val1"}, count=CountMethod.exact)
 
@@ -258,6 +279,9 @@ class TestApiResponse:
             is None
         )
 
+    def test_get_count_from_content_range_header_with_unknown_count(self):
+        assert APIResponse._get_count_from_content_range_header("0-9/*") is None
+
     def test_is_count_in_prefer_header_true(self, prefer_header_with_count: str):
         assert APIResponse._is_count_in_prefer_header(prefer_header_with_count)
 
@@ -300,3 +324,12 @@ class TestApiResponse:
         result = APIResponse.from_http_request_response(request_response_with_data)
         assert result.data == api_response
         assert result.count == 2
+
+    def test_construct_from_http_request_response_constructor(
+        self, request_response_with_data: Response, api_response: List[Dict[str, Any]]
+    ):
+        result = APIResponse.construct_from_http_request_response(
+            request_response_with_data
+        )
+        assert result.data == api_response
+        assert result.count == 2
@@ -1,7 +1,9 @@
 import pytest
-from httpx import BasicAuth, Headers
+from httpx import BasicAuth, Headers, MockTransport, Request, Response
 
 from postgrest import SyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_LIMITS
+from postgrest.utils import SyncClient
 
 
 @pytest.fixture
@@ -74,3 +76,61 @@ def test_params_purged_after_execute(postgrest_client: SyncPostgrestClient):
     assert len(postgrest_client.session.params) == 0
     postgrest_client.from_("test").select("a", "b").eq("c", "d").execute()
     assert len(postgrest_client.session.params) == 0
+
+
+class TestSession:
+    def test_limits(self, postgrest_client: SyncPostgrestClient):
+        pool = postgrest_client.session._transport._pool
+
+        limits = DEFAULT_POSTGREST_CLIENT_LIMITS
+        assert pool._max_connections == limits.max_connections
+        assert pool._max_keepalive_connections == limits.max_keepalive_connections
+        assert pool._keepalive_expiry == limits.keepalive_expiry
+
+    @pytest.mark.asyncio
+    def test_http2_passed_to_create_session(self):
+        http2_flags = []
+
+        class Client(SyncPostgrestClient):
+            def create_session(self, base_url, headers, timeout, http2=False):
+                http2_flags.append(http2)
+                return super().create_session(base_url, headers, timeout)
+
+        with Client("https://example.com", http2=True):
+            pass
+        with Client("https://example.com"):
+            pass
+
+        assert http2_flags == [True, False]
+
+    @pytest.mark.asyncio
+    def test_http2(self):
+        pytest.importorskip("h2")
+        with SyncPostgrestClient("https://example.com", http2=True) as client:
+            assert client.session._transport._pool._http2
+
+
+@pytest.mark.asyncio
+def test_prewarm():
+    sent_requests = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return Response(200)
+
+    class Client(SyncPostgrestClient):
+        # the signature of create_session() before http2 was added to it
+        def create_session(self, base_url, headers, timeout):
+            return SyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=timeout,
+                transport=MockTransport(handler),
+            )
+
+    with Client("https://example.com/rest/v1") as client:
+        client.prewarm()
+
+    assert len(sent_requests) == 1
+    assert sent_requests[0].method == "HEAD"
+    assert sent_requests[0].url == "https://example.com/rest/v1/"
@@ -1,5 +1,5 @@
 import pytest
-from httpx import Headers, QueryParams
+from httpx import Headers, MockTransport, QueryParams, Request, Response
 
 from postgrest import SyncFilterRequestBuilder
 from postgrest.utils import SyncClient
@@ -79,3 +79,21 @@ def test_contained_by_mixed_items(filter_request_builder):
 
     # {a,["b",+"c"]}
     assert str(builder.params) == "x=cd.%7Ba%2C%5B%22b%22%2C+%22c%22%5D%7D"
+
+
+def test_execute_sends_chained_filters():
+    sent_requests = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return Response(200, json=[])
+
+    with SyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builder = SyncFilterRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams({"select": "*"}), {}
+        )
+        builder.eq("a", 1).gt("b", 2).execute()
+
+    assert sent_requests[0].url.query == b"select=%2A&a=eq.1&b=gt.2"
@@ -1,7 +1,11 @@
+import json
+from typing import List, Tuple
+
 import pytest
-from httpx import Headers, QueryParams
+from httpx import Headers, MockTransport, QueryParams, Request, Response
 
 from postgrest import SyncQueryRequestBuilder
+from postgrest.exceptions import APIError
 from postgrest.utils import SyncClient
 
 
@@ -13,6 +17,20 @@ def query_request_builder():
         )
 
 
+def mock_client(
+    response: Response, base_url: str = "https://example.com"
+) -> Tuple[SyncClient, List[Request]]:
+    """Create a client which answers every request with `response`."""
+    sent_requests: List[Request] = []
+
+    def handler(request: Request) -> Response:
+        sent_requests.append(request)
+        return response
+
+    client = SyncClient(base_url=base_url, transport=MockTransport(handler))
+    return client, sent_requests
+
+
 def test_constructor(query_request_builder: SyncQueryRequestBuilder):
     builder = query_request_builder
 
@@ -21,3 +39,78 @@ def test_constructor(query_request_builder: SyncQueryRequestBuilder):
     assert len(builder.params) == 0
     assert builder.http_method == "GET"
     assert builder.json == {}
+
+
+def test_execute_success():
+    client, _ = mock_client(Response(200, json=[{"id": 1}]))
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        response = builder.execute()
+
+    assert response.data == [{"id": 1}]
+    assert response.count is None
+
+
+def test_execute_error():
+    client, _ = mock_client(
+        Response(400, json={"message": "bad request", "code": "22P02"})
+    )
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            builder.execute()
+
+    assert exc_info.value.message == "bad request"
+    assert exc_info.value.code == "22P02"
+
+
+def test_execute_error_not_json():
+    client, _ = mock_client(Response(502, text="Bad Gateway"))
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            builder.execute()
+
+    assert exc_info.value.message == "Bad Gateway"
+
+
+def test_execute_sends_json_body():
+    client, sent_requests = mock_client(Response(201, json=[{"id": 1}]))
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "POST", Headers(), QueryParams(), {"id": 1}
+        )
+        builder.execute()
+
+    assert json.loads(sent_requests[0].content) == {"id": 1}
+    assert sent_requests[0].headers["Content-Type"] == "application/json"
+
+
+def test_execute_get_has_no_body():
+    client, sent_requests = mock_client(Response(200, json=[]))
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        builder.execute()
+
+    assert sent_requests[0].content == b""
+
+
+def test_execute_appends_path_to_base_url():
+    client, sent_requests = mock_client(
+        Response(200, json=[]), base_url="https://example.com/rest/v1"
+    )
+    with client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        builder.execute()
+
+    assert sent_requests[0].url == "https://example.com/rest/v1/example_table"
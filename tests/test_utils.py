@@ -0,0 +1,211 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from httpx import Headers, MockTransport, QueryParams, Request, Response
+
+from postgrest import AsyncQueryRequestBuilder, SyncQueryRequestBuilder
+from postgrest.utils import AsyncClient, SyncClient, json_dumps, json_loads
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_identical_get_requests():
+    requests_sent = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        await asyncio.sleep(0.01)
+        return Response(200, json=[{"id": 1}])
+
+    async with AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        client.coalesce_requests = True
+        builders = [
+            AsyncQueryRequestBuilder(
+                client, "/example_table", "GET", Headers(), QueryParams(), {}
+            )
+            for _ in range(3)
+        ]
+        responses = await asyncio.gather(*(builder.execute() for builder in builders))
+
+    assert requests_sent == 1
+    assert all(response.data == [{"id": 1}] for response in responses)
+    # every caller gets its own copy of the data
+    assert len({id(response.data) for response in responses}) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_passes_errors_to_coalesced_requests():
+    requests_sent = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async with AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        client.coalesce_requests = True
+        builders = [
+            AsyncQueryRequestBuilder(
+                client, "/example_table", "GET", Headers(), QueryParams(), {}
+            )
+            for _ in range(3)
+        ]
+        results = await asyncio.gather(
+            *(builder.execute() for builder in builders), return_exceptions=True
+        )
+
+    assert requests_sent == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_coalesce_by_default():
+    requests_sent = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        await asyncio.sleep(0.01)
+        return Response(200, json=[{"id": 1}])
+
+    async with AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builders = [
+            AsyncQueryRequestBuilder(
+                client, "/example_table", "GET", Headers(), QueryParams(), {}
+            )
+            for _ in range(3)
+        ]
+        await asyncio.gather(*(builder.execute() for builder in builders))
+
+    assert requests_sent == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_when_the_coalesced_request_is_cancelled():
+    requests_sent = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        await asyncio.sleep(0.05)
+        return Response(200, json=[{"id": 1}])
+
+    async with AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        client.coalesce_requests = True
+        first = asyncio.ensure_future(client.send(client.build_request("GET", "/")))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(client.send(client.build_request("GET", "/")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        response = await second
+
+    assert requests_sent == 2
+    assert response.json() == [{"id": 1}]
+
+
+def test_sync_client_coalesces_identical_get_requests():
+    requests_sent = 0
+
+    def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        time.sleep(0.1)
+        return Response(200, json=[{"id": 1}])
+
+    with SyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        client.coalesce_requests = True
+        builders = [
+            SyncQueryRequestBuilder(
+                client, "/example_table", "GET", Headers(), QueryParams(), {}
+            )
+            for _ in range(3)
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(executor.map(lambda builder: builder.execute(), builders))
+
+    assert requests_sent == 1
+    assert all(response.data == [{"id": 1}] for response in responses)
+    assert len({id(response.data) for response in responses}) == 3
+
+
+def test_sync_client_passes_errors_to_coalesced_requests():
+    requests_sent = 0
+
+    def handler(request: Request) -> Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        time.sleep(0.1)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with SyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        client.coalesce_requests = True
+        builders = [
+            SyncQueryRequestBuilder(
+                client, "/example_table", "GET", Headers(), QueryParams(), {}
+            )
+            for _ in range(3)
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(builder.execute) for builder in builders]
+            errors = [future.exception() for future in futures]
+
+    assert requests_sent == 1
+    assert all(isinstance(error, httpx.ConnectError) for error in errors)
+
+
+@pytest.mark.asyncio
+async def test_query_with_plain_httpx_async_client():
+    async def handler(request: Request) -> Response:
+        return Response(200, json=[{"id": 1}])
+
+    async with httpx.AsyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        response = await builder.execute()
+
+    assert response.data == [{"id": 1}]
+
+
+def test_query_with_plain_httpx_client():
+    def handler(request: Request) -> Response:
+        return Response(200, json=[{"id": 1}])
+
+    with httpx.Client(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builder = SyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        response = builder.execute()
+
+    assert response.data == [{"id": 1}]
+
+
+def test_json_dumps_large_int():
+    assert json_loads(json_dumps({"id": 2**70})) == {"id": 2**70}
+
+
+def test_json_loads_keeps_numbers_exact():
+    content = b'[{"n": 123456789012345678901234567890, "m": 1e400}]'
+    assert json_loads(content) == [
+        {"n": 123456789012345678901234567890, "m": float("inf")}
+    ]